@@ -28,11 +28,11 @@ def main():
     print("=" * 50)
 
     try:
-        print("Loading ResNet50 model...")
+        print("Creating ResNet50 classifier...")
         classifier = create_classifier()
-        print("✓ Model loaded successfully!")
+        print("✓ Classifier created successfully!")
 
-        print(f"✓ Model is ready: {classifier.is_model_loaded()}")
+        print(f"✓ Model weights loaded: {classifier.is_model_loaded()} (loaded on first prediction)")
         print(f"✓ Transform pipeline configured: {classifier.transform is not None}")
         print(f"✓ Class labels loaded: {len(classifier.class_labels)} classes available")
 
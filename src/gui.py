@@ -11,12 +11,16 @@ from PIL import Image, ImageTk
 import threading
 import os
 import logging
+from collections import OrderedDict
 from .model import create_classifier
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of recently displayed image previews kept in memory
+PREVIEW_CACHE_SIZE = 16
+
 
 class ImageClassifierGUI:
     """
@@ -33,6 +37,7 @@ class ImageClassifierGUI:
         self.root = root
         self.classifier = None
         self.current_image_path = None
+        self._preview_cache = OrderedDict()
         self.setup_ui()
         self.load_model()
 
@@ -152,11 +157,17 @@ class ImageClassifierGUI:
         def load_in_background():
             try:
                 self.progress.start()
-                self.classifier = create_classifier()
+                classifier = create_classifier()
+                # The classifier loads lazily; load it here, off the UI thread
+                classifier.load_model()
+                self.classifier = classifier
                 self.root.after(0, self._on_model_loaded)
             except Exception as e:
-                self.root.after(0, lambda: self._on_model_error(str(e)))
+                error_msg = str(e)
+                self.root.after(0, lambda: self._on_model_error(error_msg))
 
+        # Daemon thread, so closing the window mid-download or mid-warm-up
+        # exits immediately instead of waiting for the load to finish
         thread = threading.Thread(target=load_in_background, daemon=True)
         thread.start()
 
@@ -197,15 +208,27 @@ class ImageClassifierGUI:
     def display_image(self, image_path):
         """Display the selected image in the GUI."""
         try:
-            # Load and resize image for display
-            image = Image.open(image_path)
+            # Reuse the preview of a recently displayed, unchanged file
+            cache_key = (image_path, os.path.getmtime(image_path))
+            photo = self._preview_cache.get(cache_key)
+
+            if photo is None:
+                # Load and resize image for display
+                image = Image.open(image_path)
+
+                # Calculate display size (max 400x400, maintain aspect ratio);
+                # bilinear is indistinguishable from Lanczos at preview size
+                max_size = (400, 400)
+                image.thumbnail(max_size, Image.Resampling.BILINEAR)
 
-            # Calculate display size (max 400x400, maintain aspect ratio)
-            max_size = (400, 400)
-            image.thumbnail(max_size, Image.Resampling.LANCZOS)
+                # Convert to PhotoImage
+                photo = ImageTk.PhotoImage(image)
 
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(image)
+                self._preview_cache[cache_key] = photo
+                if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
+            else:
+                self._preview_cache.move_to_end(cache_key)
 
             # Update image label
             self.image_label.config(image=photo, text="")
@@ -225,17 +248,19 @@ class ImageClassifierGUI:
             messagebox.showerror("Model Error", "Model is not loaded.")
             return
 
-        # Run classification in background thread
-        def classify_in_background():
+        # Run classification on the classifier's worker threads
+        self._on_classification_start()
+        future = self.classifier.predict_async(self.current_image_path, top_k=5)
+
+        def on_classified(completed):
             try:
-                self.root.after(0, self._on_classification_start)
-                predictions = self.classifier.predict(self.current_image_path, top_k=5)
+                predictions = completed.result()
                 self.root.after(0, lambda: self._on_classification_complete(predictions))
             except Exception as e:
-                self.root.after(0, lambda: self._on_classification_error(str(e)))
+                error_msg = str(e)
+                self.root.after(0, lambda: self._on_classification_error(error_msg))
 
-        thread = threading.Thread(target=classify_in_background, daemon=True)
-        thread.start()
+        future.add_done_callback(on_classified)
 
     def _on_classification_start(self):
         """Called when classification starts."""
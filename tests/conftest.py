@@ -0,0 +1,96 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import os
+
+# Single-image inference gains nothing from a thread pool; this must be set
+# before torch is first imported
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _torch_cpu_single_thread():
+    """Pin torch to a single CPU thread."""
+    import torch
+
+    torch.set_num_threads(1)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Already fixed once any parallel work has started
+
+
+@pytest.fixture(scope="session")
+def classifier():
+    """Load the shared classifier model."""
+    import torch
+    from src.model import create_classifier
+
+    classifier = create_classifier()
+    classifier.load_model()  # Already in eval mode and frozen for inference
+
+    # No test needs autograd; restore the global flag at the end of the session
+    grad_enabled = torch.is_grad_enabled()
+    torch.set_grad_enabled(False)
+    yield classifier
+    torch.set_grad_enabled(grad_enabled)
+
+
+@pytest.fixture(scope="session")
+def sample_pil_image():
+    """Create a small in-memory sample image."""
+    from PIL import Image
+
+    # Preprocessing resizes to 224x224, so a tiny image is enough
+    return Image.new('RGB', (32, 32), color=(128, 128, 128))
+
+
+@pytest.fixture(scope="session")
+def sample_image_path(sample_pil_image, tmp_path_factory):
+    """Write the sample JPEG."""
+    path = tmp_path_factory.mktemp("images") / "sample.jpg"
+    sample_pil_image.save(path, 'JPEG')
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def predictions(classifier, sample_image_path):
+    """Run top-10 inference on the sample image."""
+    return classifier.predict(sample_image_path, top_k=10)
+
+
+@pytest.fixture(scope="session")
+def preprocessed_tensor(classifier, sample_image_path):
+    """Preprocess the sample image."""
+    # Clone: on CUDA the result lives in the classifier's reusable input buffer
+    return classifier.preprocess_image(sample_image_path).clone()
+
+
+@pytest.fixture(scope="session")
+def tk_root():
+    """Create a hidden tkinter root window."""
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk is not available: {e}")
+
+    root.withdraw()  # Hide the window during testing
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def root(tk_root):
+    """Provide the shared root window and clean up what each test created."""
+    yield tk_root
+
+    # Destroy widgets built by the test and drop any pending after() callbacks
+    for widget in tk_root.winfo_children():
+        widget.destroy()
+    for after_id in tk_root.tk.splitlist(tk_root.tk.call("after", "info")):
+        tk_root.after_cancel(after_id)
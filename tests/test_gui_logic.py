@@ -0,0 +1,27 @@
+"""
+Unit tests for GUI logic that do not need tkinter.
+"""
+
+
+class TestGUILogic:
+    """Test GUI logic without creating actual widgets."""
+
+    def test_prediction_formatting(self):
+        """Test prediction result formatting logic."""
+        predictions = [
+            ("cat", 0.85432),
+            ("dog", 0.12345),
+            ("bird", 0.02223)
+        ]
+
+        # This would be the logic inside display_results
+        formatted_results = []
+        for i, (class_name, confidence) in enumerate(predictions, 1):
+            confidence_percent = confidence * 100
+            result_text = f"{i}. {class_name}\n   Confidence: {confidence_percent:.2f}%\n\n"
+            formatted_results.append(result_text)
+
+        assert "1. cat" in formatted_results[0]
+        assert "85.43%" in formatted_results[0]
+        assert "2. dog" in formatted_results[1]
+        assert "12.35%" in formatted_results[1]